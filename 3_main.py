@@ -4,32 +4,110 @@ Main application class for image editor GUI.
 Provides a complete graphical interface for image processing with controls
 for effects, adjustments, transformations, and file operations.
 """
-import sys
 import os
-from pathlib import Path
-
-# Add current directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import cv2
-from PIL import Image, ImageTk, ImageDraw
-import importlib
-
-# Import modules dynamically (updated names)
-image_processing_module = importlib.import_module("1_image_processing")
-image_display_module = importlib.import_module("2_image_display")
+from PIL import Image, ImageTk
 
-ImageModel = image_processing_module.ImageModel
-ScrollableImageCanvas = image_display_module.ScrollableImageCanvas
+from image_processing import ImageModel
+from image_display import ScrollableImageCanvas
 
 
 # Set application theme
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
 
+# Menu styling shared by all dropdown menus
+_MENU_THEME = types.MappingProxyType({
+    "bg": "#2b2b2b", 
+    "fg": "white", 
+    "activebackground": "#555", 
+    "activeforeground": "white", 
+    "tearoff": 0, 
+    "bd": 0
+})
+
+# Menu icon files, loaded from the icons directory next to this module
+_ICON_NAMES = ["open", "save", "save_as", "undo", "redo", "close"]
+_ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
+
+# Prepared menu icons shared across App instances, keyed by (dir, name, mtime)
+_ICON_CACHE = {}
+_ICON_CACHE_LOCK = threading.Lock()
+
+# Bump when the icon pipeline changes so stale disk caches are ignored
+_ICON_PIPELINE_VERSION = 2
+
+# Shared white square used for every missing icon file
+_PLACEHOLDER_ICON = Image.new('RGBA', (18, 18), (0, 0, 0, 0))
+_PLACEHOLDER_ICON.paste((255, 255, 255, 255), (2, 2, 17, 17))
+
+
+def _prepare_icon(icon_path, name):
+    """Return processed 18x18 PIL icon, using memory and disk caches."""
+    path = os.path.join(icon_path, f"{name}.png")
+    mtime = os.path.getmtime(path) if os.path.exists(path) else None
+    key = (icon_path, name, mtime)
+
+    # Reuse icon already prepared in this process
+    with _ICON_CACHE_LOCK:
+        img = _ICON_CACHE.get(key)
+    if img is not None:
+        return img
+
+    # Reuse pre-resized icon from disk if newer than source
+    img = None
+    cache_path = os.path.join(icon_path, "_cache", f"{name}_18_v{_ICON_PIPELINE_VERSION}.png")
+    if mtime is not None and os.path.exists(cache_path) and os.path.getmtime(cache_path) >= mtime:
+        try:
+            img = Image.open(cache_path)
+            img.load()
+        except OSError:
+            img = None
+
+    # Use placeholder if icon file is missing
+    if mtime is None:
+        img = _PLACEHOLDER_ICON
+
+    if img is None:
+        # Load from file in RGBA format before resizing
+        img = Image.open(path)
+        img = img.convert('RGBA') if img.mode != 'RGBA' else img
+        img.load()
+        
+        # Resize icon to 18x18 pixels; bilinear is enough at this size
+        if img.size != (18, 18):
+            img = img.resize((18, 18), Image.Resampling.BILINEAR)
+        
+        # Paint icon white, keeping its alpha channel for proper display
+        white = Image.new('RGBA', img.size, (255, 255, 255, 255))
+        white.putalpha(img.getchannel('A'))
+        img = white
+
+        # Persist resized icon so later launches skip the pipeline
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            img.save(cache_path, optimize=True)
+        except OSError:
+            pass
+
+    # Store PIL image; PhotoImage must be created on the Tk thread
+    with _ICON_CACHE_LOCK:
+        _ICON_CACHE[key] = img
+    return img
+
+
+def _default_fmt(name):
+    """Return label formatter showing slider value with two decimals."""
+    return lambda v, n=name: f"{n}: {v:.2f}"
+
+
 class App(ctk.CTk):
     """
     Main application window for image editor.
@@ -37,6 +115,12 @@ class App(ctk.CTk):
     Manages UI layout, user interactions, file operations, and coordinates
     between the model and view components.
     """
+
+    # Label formatters for integer-valued sliders
+    _SLIDER_FORMATTERS = {
+        "Blur": lambda v: f"Blur: {int(v)}",
+        "Brightness": lambda v: f"Brightness: {int(v)}",
+    }
     
     def __init__(self):
         """Initialize main application window."""
@@ -51,9 +135,16 @@ class App(ctk.CTk):
         self.model = ImageModel()
         
         # UI state
-        self.menu_icons = {}
-        self.load_menu_icons()
+        self.menu_icons = types.SimpleNamespace()
+        self.menu_icon_entries = []
+        self._icons_attached = False
         self.slider_labels = {} 
+        self._resize_after_id = None
+
+        # Decode menu icons while widgets are being built
+        self._icons_ready = threading.Event()
+        self._pending_pil_icons = {}
+        threading.Thread(target=self._decode_icons_bg, daemon=True).start()
 
         # Build UI components
         self.build_native_menu()
@@ -65,79 +156,89 @@ class App(ctk.CTk):
         self.image_area.pack(side="top", fill="both", expand=True)
 
         # Bind resize event
-        self.bind("<Configure>", self.on_resize)
+        self.bind("<Configure>", self._on_resize_debounced)
+
+    def _decode_icons_bg(self):
+        """Prepare PIL menu icons in a background thread."""
+        try:
+            # Decode and process icons in parallel; PIL releases the GIL
+            workers = min(len(_ICON_NAMES), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(_prepare_icon, _ICON_DIR, name): name for name in _ICON_NAMES}
+                for future in as_completed(futures):
+                    # Skip failed icons; load_menu_icons retries them once on the Tk thread
+                    try:
+                        self._pending_pil_icons[futures[future]] = future.result()
+                    except Exception:
+                        continue
+        finally:
+            # Always release the Tk thread waiting for icons
+            self._icons_ready.set()
 
     def load_menu_icons(self):
         """Load or create menu icons from files."""
-        # Icon names to load
-        icon_names = ["open", "save", "save_as", "undo", "redo", "close"]
+        # Wait for background decoding to finish
+        self._icons_ready.wait()
         
-        # Get icons directory
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        icon_path = os.path.join(base_dir, "icons") 
-
-        # Load or create each icon
-        for name in icon_names:
-            path = os.path.join(icon_path, f"{name}.png")
-            
-            # Load from file if exists, otherwise create placeholder
-            if os.path.exists(path):
-                img = Image.open(path)
-            else:
-                # Create blank white rectangle as placeholder
-                img = Image.new('RGBA', (20, 20), (0, 0, 0, 0))
-                d = ImageDraw.Draw(img)
-                d.rectangle([2,2,18,18], fill="white")
-            
-            # Resize icon to 18x18 pixels
-            img = img.resize((18, 18), Image.Resampling.LANCZOS)
+        # Convert to PhotoImage on the Tk thread
+        for name in _ICON_NAMES:
+            img = self._pending_pil_icons.get(name)
             
-            # Ensure RGBA format
-            if img.mode != 'RGBA': 
-                img = img.convert('RGBA')
-            
-            # Extract alpha channel
-            r, g, b, a = img.split()
-            
-            # Create white background
-            white_bg = Image.new('RGB', img.size, (255, 255, 255))
-            
-            # Combine with alpha for proper display
-            img = Image.merge('RGBA', (*white_bg.split(), a))
-            
-            # Convert to PhotoImage
-            self.menu_icons[name] = ImageTk.PhotoImage(img)
+            # Prepare here if background decoding failed for this icon
+            if img is None:
+                try:
+                    img = _prepare_icon(_ICON_DIR, name)
+                except OSError:
+                    # Unreadable icon file, fall back to placeholder
+                    img = _PLACEHOLDER_ICON
+            setattr(self.menu_icons, name, ImageTk.PhotoImage(img))
+
+    def _ensure_icons_loaded(self):
+        """Load menu icons on first menu open and attach them to entries."""
+        # Skip if icons already attached
+        if self._icons_attached:
+            return
+        
+        try:
+            self.load_menu_icons()
+        finally:
+            # Attach each loaded icon, even if loading stopped partway
+            for menu, index, name in self.menu_icon_entries:
+                icon = getattr(self.menu_icons, name, None)
+                if icon is not None:
+                    menu.entryconfigure(index, image=icon, compound="left")
+        self._icons_attached = True
     
     def build_native_menu(self):
         """Build native menu bar with File and Edit menus."""
-        # Menu styling
-        menu_theme = {
-            "bg": "#2b2b2b", 
-            "fg": "white", 
-            "activebackground": "#555", 
-            "activeforeground": "white", 
-            "tearoff": 0, 
-            "bd": 0
-        }
-        
         # Create menu bar
         menubar = tk.Menu(self) 
         self.config(menu=menubar)
 
         # File menu
-        file_menu = tk.Menu(menubar, **menu_theme)
+        file_menu = tk.Menu(menubar, postcommand=self._ensure_icons_loaded, **_MENU_THEME)
         menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label=" Open", image=self.menu_icons["open"], compound="left", command=self.open_image)
-        file_menu.add_command(label=" Save", image=self.menu_icons["save"], compound="left", command=self.save)
-        file_menu.add_command(label=" Save As", image=self.menu_icons["save_as"], compound="left", command=self.save_as)
+        file_menu.add_command(label=" Open", command=self.open_image)
+        file_menu.add_command(label=" Save", command=self.save)
+        file_menu.add_command(label=" Save As", command=self.save_as)
         file_menu.add_separator()
-        file_menu.add_command(label=" Exit", image=self.menu_icons["close"], compound="left", command=self.confirm_exit)
+        file_menu.add_command(label=" Exit", command=self.confirm_exit)
 
         # Edit menu
-        edit_menu = tk.Menu(menubar, **menu_theme)
+        edit_menu = tk.Menu(menubar, postcommand=self._ensure_icons_loaded, **_MENU_THEME)
         menubar.add_cascade(label="Edit", menu=edit_menu)
-        edit_menu.add_command(label=" Undo", image=self.menu_icons["undo"], compound="left", command=self.undo)
-        edit_menu.add_command(label=" Redo", image=self.menu_icons["redo"], compound="left", command=self.redo)
+        edit_menu.add_command(label=" Undo", command=self.undo)
+        edit_menu.add_command(label=" Redo", command=self.redo)
+
+        # Icons are attached when a menu is first opened
+        self.menu_icon_entries = [
+            (file_menu, 0, "open"),
+            (file_menu, 1, "save"),
+            (file_menu, 2, "save_as"),
+            (file_menu, 4, "close"),
+            (edit_menu, 0, "undo"),
+            (edit_menu, 1, "redo"),
+        ]
 
     def build_status_bar(self):
         """Build status bar at bottom of window."""
@@ -195,19 +296,35 @@ class App(ctk.CTk):
             lbl.pack(side="left")
             self.slider_labels[name] = lbl
 
-            # Update label text on drag
-            def on_drag_wrapper(val):
-                # Format value for display
-                if name == "Blur" or name == "Brightness": 
-                    display_val = int(val)
-                else: 
-                    display_val = f"{val:.2f}"
-                
+            # Choose value formatter once per slider
+            fmt = self._SLIDER_FORMATTERS.get(name) or _default_fmt(name)
+
+            # Latest drag value waiting to be processed
+            pending = [None]
+            scheduled = [False]
+
+            # Run drag callback with the latest value only
+            def _flush():
+                scheduled[0] = False
+                if pending[0] is not None:
+                    val, pending[0] = pending[0], None
+                    cmd_drag(val)
+
+            # Update label text on drag, coalesce callbacks until idle
+            def on_drag_wrapper(val, _lbl=lbl, _fmt=fmt):
                 # Update label
-                self.slider_labels[name].configure(text=f"{name}: {display_val}")
+                _lbl.configure(text=_fmt(val))
                 
-                # Call drag callback
-                cmd_drag(val)
+                # Schedule drag callback
+                pending[0] = val
+                if not scheduled[0]:
+                    scheduled[0] = True
+                    self.after_idle(_flush)
+
+            # Apply pending value before release callback
+            def on_release_wrapper(event):
+                _flush()
+                cmd_rel(event)
 
             # Reset button action
             def reset_action():
@@ -218,7 +335,7 @@ class App(ctk.CTk):
                 on_drag_wrapper(default_val) 
                 
                 # Call release callback
-                cmd_rel(None)
+                on_release_wrapper(None)
 
             # Create reset button if needed
             if show_reset:
@@ -246,7 +363,7 @@ class App(ctk.CTk):
             
             # Bind slider events
             slider.configure(command=on_drag_wrapper)
-            slider.bind("<ButtonRelease-1>", cmd_rel)
+            slider.bind("<ButtonRelease-1>", on_release_wrapper)
             
             return slider
  # Create adjustment sliders
@@ -309,6 +426,22 @@ class App(ctk.CTk):
         self.slider_labels["Blur"].configure(text=f"Blur: {self.model.blur}")
         self.slider_labels["Resize"].configure(text=f"Resize: {self.model.scale:.2f}")
 
+    def _on_resize_debounced(self, event):
+        """Defer resize handling until the window stops changing size."""
+        # Ignore configure events propagated from child widgets
+        if event.widget is not self:
+            return
+        
+        # Restart timer so only the final size is handled
+        if self._resize_after_id:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(50, self._fire_resize, event)
+
+    def _fire_resize(self, event):
+        """Run resize handler once the debounce timer expires."""
+        self._resize_after_id = None
+        self.on_resize(event)
+
     def on_resize(self, event):
         """Handle window resize event."""
         pass